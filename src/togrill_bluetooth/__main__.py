@@ -19,7 +19,7 @@ from .packets import (
     PacketA7Write,
     PacketA300Write,
     PacketA301Write,
-    PacketNotify,
+    decode_packet,
 )
 from .services import Characteristic, NotifyCharacteristic, WriteCharacteristic
 
@@ -70,8 +70,8 @@ async def connect(ctx: click.Context, address: str, code: str):
 
     def notify_data(char_specifier: BleakGATTCharacteristic, data: bytearray):
         try:
-            packet_data = NotifyCharacteristic.decode(data)
-            packet = PacketNotify.decode(packet_data)
+            packet_data = NotifyCharacteristic.decode(memoryview(data))
+            packet = decode_packet(packet_data)
             click.echo(f"Notify: {packet}")
         except DecodeError as exc:
             click.echo(f"Failed to decode: {data.hex()} with error {exc}")
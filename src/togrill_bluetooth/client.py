@@ -12,7 +12,7 @@ from bleak_retry_connector import establish_connection
 
 from .const import MainService
 from .exceptions import DecodeError, WriteFailed
-from .packets import Packet, PacketNotify, PacketNotifyAck, PacketWrite
+from .packets import Packet, PacketNotify, PacketNotifyAck, PacketWrite, decode_packet
 from .services import NotifyCharacteristic, WriteCharacteristic
 
 _LOGGER = logging.getLogger(__name__)
@@ -40,8 +40,8 @@ class Client:
     async def _start_notify(self):
         def notify_data(char_specifier: BleakGATTCharacteristic, data: bytearray):
             try:
-                packet_data = NotifyCharacteristic.decode(data)
-                packet = PacketNotify.decode(packet_data)
+                packet_data = NotifyCharacteristic.decode(memoryview(data))
+                packet = decode_packet(packet_data)
                 _LOGGER.debug("Notify: %s", packet)
             except DecodeError as exc:
                 _LOGGER.error("Failed to decode: %s with error %s", data, exc)
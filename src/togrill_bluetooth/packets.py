@@ -1,49 +1,88 @@
 from __future__ import annotations
 
 import logging
+import struct
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import timedelta
 from enum import IntEnum
+from functools import cache
 from typing import ClassVar, Self
 
 from .exceptions import DecodeError
+from .services import Buffer
 
-_PACKET_REGISTRY: dict[int, list[type[PacketNotify]]] = {}
+_PACKET_DISPATCH: list[Callable[[Buffer], PacketNotify] | None] = [None] * 256
 _LOGGER = logging.getLogger(__name__)
 
+_A0_HDR = struct.Struct(">xBBBxB")
+_A3_MINMAX = struct.Struct(">xBxHH")
+_A3_TARGET = struct.Struct(">xBxHxx")
+_A3_WRITE = struct.Struct(">BBBHH")
+_A7_WRITE_UNPACK = struct.Struct(">xBBH")
+_A7_WRITE_PACK = struct.Struct(">BBBH")
+_A8_NOTIFY_PACK = struct.Struct(">BBBHHHHH")
 
-def from_scaled_nullable(data: bytes, scale: float, null: int) -> float | None:
-    if (value := from_nullable(data, null)) is None:
+_REQUEST_A0 = bytes.fromhex("a00000")
+_REQUEST_A1 = bytes.fromhex("a100")
+
+
+def from_scaled_nullable_int(value: int, scale: float, null: int) -> float | None:
+    if value == null:
         return None
     return value / scale
 
 
-def to_scaled_nullable(data: float | None, length: int, scale: float, null: int) -> bytes:
+def to_scaled_nullable_int(data: float | None, scale: float, null: int) -> int:
     if data is None:
-        return null.to_bytes(length, "big")
-    return round(data * scale).to_bytes(length, "big")
+        return null
+    return round(data * scale)
 
 
-def from_nullable(data: bytes, null: int) -> int | None:
-    value = int.from_bytes(data, "big")
+def from_nullable_enum_int(value: int, enum: type[IntEnum], null: int) -> int | None:
     if value == null:
         return None
-    return value
-
-
-def from_nullable_enum(data: bytes, enum: type[IntEnum], null: int) -> int | None:
-    if (value := from_nullable(data, null)) is None:
-        return None
     try:
         return enum(value)
     except ValueError:
         return value
 
 
-def to_nullable(data: int | None, length: int, null: int) -> bytes:
+def to_nullable_int(data: int | None, null: int) -> int:
     if data is None:
-        return null.to_bytes(length, "big")
-    return data.to_bytes(length, "big")
+        return null
+    return data
+
+
+def pack_packet(packer: struct.Struct, *values: int) -> bytes:
+    try:
+        return packer.pack(*values)
+    except struct.error as exc:
+        raise ValueError(f"Failed to encode packet: {exc}") from exc
+
+
+@cache
+def _temperatures_struct(count: int) -> struct.Struct:
+    return struct.Struct(f">x{count}H")
+
+
+def from_temperature(value: int) -> float | None:
+    if value == 0xFFFF:
+        return None
+    if value > 0x8000:
+        return (value - 0x8000) / 10
+    return value / 10
+
+
+class _TemperatureTable(dict[int, float | None]):
+    """Raw probe value to temperature, filled in on first use of each value."""
+
+    def __missing__(self, value: int) -> float | None:
+        temperature = self[value] = from_temperature(value)
+        return temperature
+
+
+_TEMPERATURES = _TemperatureTable()
 
 
 class GrillType(IntEnum):
@@ -77,45 +116,35 @@ class AlarmType(IntEnum):
     TEMPERATURE_TARGET = 1
 
 
-@dataclass
+@dataclass(slots=True)
 class Packet:
     type: ClassVar[int]
 
     @classmethod
-    def decode(cls, data: bytes) -> Self:
+    def decode(cls, data: Buffer) -> Self:
         raise NotImplementedError()
 
     def encode(self) -> bytes:
         raise NotImplementedError()
 
 
-@dataclass
+@dataclass(slots=True)
 class PacketNotify(Packet):
-    def __init_subclass__(cls, /, **kwargs):
-        super().__init_subclass__(**kwargs)
-        if packet_type := getattr(cls, "type", None):
-            _PACKET_REGISTRY.setdefault(packet_type, []).append(cls)
+    @classmethod
+    def decode(cls, data: Buffer) -> PacketNotify:
+        return decode_packet(data)
 
     @classmethod
-    def decode(cls, data: bytes) -> PacketNotify:
-        if len(data) < 1:
-            raise DecodeError("Failed to parse packet")
-        exceptions = []
-        for registered_cls in _PACKET_REGISTRY.get(data[0], []):
-            try:
-                return registered_cls.decode(data)
-            except DecodeError as exc:
-                exceptions.append(exc)
-        if exceptions:
-            raise ExceptionGroup(f"Fail to decode {data}", exceptions)
-        return PacketUnknown(data[0], data[1:])
+    def _decode_body(cls, data: Buffer) -> Self:
+        """Decode a packet whose type byte has already been matched."""
+        raise NotImplementedError()
 
     @classmethod
     def request(cls) -> bytes:
         raise NotImplementedError
 
 
-@dataclass
+@dataclass(slots=True)
 class PacketNotifyAck(PacketNotify):
     """Set timer."""
 
@@ -123,18 +152,18 @@ class PacketNotifyAck(PacketNotify):
     data: int
 
     @classmethod
-    def decode(cls, data: bytes) -> Self:
+    def decode(cls, data: Buffer) -> Self:
         if len(data) < 2:
             raise DecodeError("Packet too short")
         return cls(data=data[1])
 
 
-@dataclass
+@dataclass(slots=True)
 class PacketWrite(Packet):
     """Base class fro packet writes."""
 
 
-@dataclass
+@dataclass(slots=True)
 class PacketA0Notify(PacketNotify):
     """Device status"""
 
@@ -149,20 +178,21 @@ class PacketA0Notify(PacketNotify):
     alarm_sound: bool
 
     @classmethod
-    def decode(cls, data: bytes) -> Self:
-        if len(data) < 6:
-            raise DecodeError("Packet too short")
-        if data[0] != cls.type:
+    def decode(cls, data: Buffer) -> Self:
+        if data and data[0] != cls.type:
             raise DecodeError("Failed to parse packet")
+        return cls._decode_body(data)
 
-        battery = data[1]
-        version_major = data[2]
-        version_minor = data[3]
-        _unknown = data[4]
-        bitfield = data[5]
-        function_type = bitfield & 0xF
-        probe_count = (bitfield >> 4) & 0x7
-        ambient = bool(bitfield >> 7)
+    @classmethod
+    def _decode_body(cls, data: Buffer) -> Self:
+        if len(data) < 6:
+            raise DecodeError("Packet too short")
+        battery, version_major, version_minor, bitfield = _A0_HDR.unpack_from(data)
+        function_type, probe_count, ambient = (
+            bitfield & 0xF,
+            (bitfield >> 4) & 0x7,
+            (bitfield & 0x80) != 0,
+        )
 
         alarm_interval = 5
         alarm_sound = True
@@ -181,62 +211,51 @@ class PacketA0Notify(PacketNotify):
             alarm_sound=alarm_sound,
         )
 
-    @classmethod
-    def request(cls) -> bytes:
-        return bytes(
-            [
-                cls.type,
-                0x00,
-                0x00,
-            ]
-        )
+    @staticmethod
+    def request() -> bytes:
+        return _REQUEST_A0
 
 
-@dataclass
+_PACKET_DISPATCH[PacketA0Notify.type] = PacketA0Notify._decode_body
+
+
+@dataclass(slots=True)
 class PacketA1Notify(PacketNotify):
     """Temperature on probes"""
 
     type: ClassVar[int] = 0xA1
-    temperatures: list[float | None]
+    temperatures: tuple[float | None, ...]
 
     @classmethod
-    def decode(cls, data: bytes) -> Self:
-        if len(data) < 1:
-            raise DecodeError("Packet too short")
-        if data[0] != cls.type:
+    def decode(cls, data: Buffer) -> Self:
+        if data and data[0] != cls.type:
             raise DecodeError("Failed to parse packet")
+        return cls._decode_body(data)
 
-        temperatures = [
-            int.from_bytes(data[index : index + 2], "big") for index in range(1, len(data), 2)
-        ]
+    @classmethod
+    def _decode_body(cls, data: Buffer) -> Self:
+        if len(data) < 1:
+            raise DecodeError("Packet too short")
+        values = _temperatures_struct((len(data) - 1) // 2).unpack_from(data)
+        return cls(temperatures=tuple(map(_TEMPERATURES.__getitem__, values)))
 
-        def convert(value: int) -> float | None:
-            if value == 65535:
-                return None
-            if value > 32768:
-                return (value - 32768) / 10
-            return value / 10
+    @staticmethod
+    def request() -> bytes:
+        return _REQUEST_A1
 
-        temperatures = [convert(temperature) for temperature in temperatures]
 
-        return cls(temperatures=temperatures)
-
-    @classmethod
-    def request(cls) -> bytes:
-        return bytes(
-            [
-                cls.type,
-                0x00,
-            ]
-        )
+_PACKET_DISPATCH[PacketA1Notify.type] = PacketA1Notify._decode_body
 
 
-@dataclass
+@dataclass(slots=True)
 class PacketA3Notify(PacketNotifyAck):
     type: ClassVar[int] = 0xA3
 
 
-@dataclass
+_PACKET_DISPATCH[PacketA3Notify.type] = PacketA3Notify.decode
+
+
+@dataclass(slots=True)
 class PacketA300Write(PacketWrite):
     """Set min max temperature."""
 
@@ -247,30 +266,30 @@ class PacketA300Write(PacketWrite):
     maximum: float | None
 
     @classmethod
-    def decode(cls, data: bytes) -> Self:
+    def decode(cls, data: Buffer) -> Self:
         if len(data) < 7:
             raise DecodeError("Packet too short")
         if data[2] != cls.alarm_type:
             raise DecodeError("Invalid subtype")
+        probe, minimum, maximum = _A3_MINMAX.unpack_from(data)
         return cls(
-            probe=data[1],
-            minimum=from_scaled_nullable(data[3:5], 10.0, 0xFFFF),
-            maximum=from_scaled_nullable(data[5:7], 10.0, 0xFFFF),
+            probe=probe,
+            minimum=from_scaled_nullable_int(minimum, 10.0, 0xFFFF),
+            maximum=from_scaled_nullable_int(maximum, 10.0, 0xFFFF),
         )
 
     def encode(self) -> bytes:
-        return bytes(
-            [
-                self.type,
-                self.probe,
-                self.alarm_type,
-                *to_scaled_nullable(self.minimum, 2, 10.0, 0xFFFF),
-                *to_scaled_nullable(self.maximum, 2, 10.0, 0xFFFF),
-            ]
+        return pack_packet(
+            _A3_WRITE,
+            self.type,
+            self.probe,
+            self.alarm_type,
+            to_scaled_nullable_int(self.minimum, 10.0, 0xFFFF),
+            to_scaled_nullable_int(self.maximum, 10.0, 0xFFFF),
         )
 
 
-@dataclass(kw_only=True)
+@dataclass(slots=True, kw_only=True)
 class PacketA301Write(PacketWrite):
     """Set target temperature."""
 
@@ -280,31 +299,30 @@ class PacketA301Write(PacketWrite):
     target: float | None
 
     @classmethod
-    def decode(cls, data: bytes) -> Self:
+    def decode(cls, data: Buffer) -> Self:
         if len(data) < 7:
             raise DecodeError("Packet too short")
         if data[2] != cls.alarm_type:
             raise DecodeError("Invalid subtype")
 
+        probe, target = _A3_TARGET.unpack_from(data)
         return cls(
-            probe=data[1],
-            target=from_scaled_nullable(data[3:5], 10.0, 0xFFFF),
+            probe=probe,
+            target=from_scaled_nullable_int(target, 10.0, 0xFFFF),
         )
 
     def encode(self) -> bytes:
-        return bytes(
-            [
-                self.type,
-                self.probe,
-                self.alarm_type,
-                *to_scaled_nullable(self.target, 2, 10.0, 0xFFFF),
-                0,
-                0,
-            ]
+        return pack_packet(
+            _A3_WRITE,
+            self.type,
+            self.probe,
+            self.alarm_type,
+            to_scaled_nullable_int(self.target, 10.0, 0xFFFF),
+            0,
         )
 
 
-@dataclass(kw_only=True)
+@dataclass(slots=True, kw_only=True)
 class PacketA303Write(PacketWrite):
     """Set grill data."""
 
@@ -315,30 +333,30 @@ class PacketA303Write(PacketWrite):
     taste: int | None = None
 
     @classmethod
-    def decode(cls, data: bytes) -> Self:
+    def decode(cls, data: Buffer) -> Self:
         if len(data) < 7:
             raise DecodeError("Packet too short")
         if data[2] != cls.alarm_type:
             raise DecodeError("Invalid subtype")
+        probe, grill_type, taste = _A3_MINMAX.unpack_from(data)
         return cls(
-            probe=data[1],
-            grill_type=from_nullable_enum(data[3:5], GrillType, 0),
-            taste=from_nullable_enum(data[5:7], Taste, 0),
+            probe=probe,
+            grill_type=from_nullable_enum_int(grill_type, GrillType, 0),
+            taste=from_nullable_enum_int(taste, Taste, 0),
         )
 
     def encode(self) -> bytes:
-        return bytes(
-            [
-                self.type,
-                self.probe,
-                self.alarm_type,
-                *to_nullable(self.grill_type, 2, 0),
-                *to_nullable(self.taste, 2, 0),
-            ]
+        return pack_packet(
+            _A3_WRITE,
+            self.type,
+            self.probe,
+            self.alarm_type,
+            to_nullable_int(self.grill_type, 0),
+            to_nullable_int(self.taste, 0),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PacketA5Notify(PacketNotify):
     """Status from probe"""
 
@@ -360,22 +378,26 @@ class PacketA5Notify(PacketNotify):
         AMBIENT_COOL_DOWN = 10
         PROBE_TIMER_ALARM = 12
 
+    _MESSAGE_MAP: ClassVar[dict[int, Message]] = {message.value: message for message in Message}
+
     @classmethod
-    def decode(cls, data: bytes) -> Self:
+    def decode(cls, data: Buffer) -> Self:
+        if data and data[0] != cls.type:
+            raise DecodeError("Failed to parse packet")
+        return cls._decode_body(data)
+
+    @classmethod
+    def _decode_body(cls, data: Buffer) -> Self:
         if len(data) < 3:
             raise DecodeError("Packet too short")
-        if data[0] != cls.type:
-            raise DecodeError("Failed to parse packet")
+        message = cls._MESSAGE_MAP.get(data[2], data[2])
+        return cls(probe=data[1], message=message)
 
-        try:
-            message = PacketA5Notify.Message(data[2])
-        except ValueError:
-            message = data[2]
 
-        return cls(probe=data[1], message=message)
+_PACKET_DISPATCH[PacketA5Notify.type] = PacketA5Notify._decode_body
 
 
-@dataclass
+@dataclass(slots=True)
 class PacketA6Write(PacketWrite):
     """Set alarm behaviour."""
 
@@ -388,7 +410,7 @@ class PacketA6Write(PacketWrite):
     alarm_interval: int | None = None
 
     @classmethod
-    def decode(cls, data: bytes) -> Self:
+    def decode(cls, data: Buffer) -> Self:
         if len(data) < 3:
             raise DecodeError("Packet too short")
         if data[1] == 0xFF:
@@ -429,7 +451,7 @@ class PacketA6Write(PacketWrite):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PacketA7Write(PacketWrite):
     """Set timer."""
 
@@ -439,31 +461,26 @@ class PacketA7Write(PacketWrite):
     unknown: int = 1
 
     @classmethod
-    def decode(cls, data: bytes) -> Self:
+    def decode(cls, data: Buffer) -> Self:
         if len(data) < 5:
             raise DecodeError("Packet too short")
-        return cls(
-            time=timedelta(seconds=int.from_bytes(data[3:5], "big")), probe=data[1], unknown=data[2]
-        )
+        probe, unknown, seconds = _A7_WRITE_UNPACK.unpack_from(data)
+        return cls(time=timedelta(seconds=seconds), probe=probe, unknown=unknown)
 
     def encode(self) -> bytes:
         seconds = round(self.time.total_seconds())
-        return bytes(
-            [
-                self.type,
-                self.probe,
-                self.unknown,
-                *seconds.to_bytes(2, "big"),
-            ]
-        )
+        return pack_packet(_A7_WRITE_PACK, self.type, self.probe, self.unknown, seconds)
 
 
-@dataclass
+@dataclass(slots=True)
 class PacketA7Notify(PacketNotifyAck):
     type: ClassVar[int] = 0xA7
 
 
-@dataclass
+_PACKET_DISPATCH[PacketA7Notify.type] = PacketA7Notify.decode
+
+
+@dataclass(slots=True)
 class PacketA8Write(PacketWrite):
     """Set alarm behaviour."""
 
@@ -472,7 +489,7 @@ class PacketA8Write(PacketWrite):
     unknown: int = 0
 
     @classmethod
-    def decode(cls, data: bytes) -> Self:
+    def decode(cls, data: Buffer) -> Self:
         if len(data) < 3:
             raise DecodeError("Packet too short")
         if data[0] != cls.type:
@@ -489,7 +506,7 @@ class PacketA8Write(PacketWrite):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PacketA8Notify(PacketNotify):
     """Status from probe"""
 
@@ -505,45 +522,58 @@ class PacketA8Notify(PacketNotify):
     AlarmType = AlarmType
 
     @classmethod
-    def decode(cls, data: bytes) -> Self:
-        if len(data) < 12:
-            raise DecodeError("Packet too short")
-        if data[0] != cls.type:
+    def decode(cls, data: Buffer) -> Self:
+        if data and data[0] != cls.type:
             raise DecodeError("Failed to parse type")
+        return cls._decode_body(data)
 
+    @classmethod
+    def _decode_body(cls, data: Buffer) -> Self:
+        if len(data) < 12:
+            raise DecodeError("Packet too short")
         return cls(
             probe=data[1],
-            alarm_type=from_nullable_enum(data[2:3], AlarmType, 0xFF),
-            temperature_1=from_scaled_nullable(data[3:5], 10.0, 0xFFFF),
-            temperature_2=from_scaled_nullable(data[5:7], 10.0, 0xFFFF),
-            grill_type=from_nullable_enum(data[7:9], GrillType, 0x0),
-            taste=from_nullable_enum(data[9:11], Taste, 0x0),
+            alarm_type=from_nullable_enum_int(data[2], AlarmType, 0xFF),
+            temperature_1=from_scaled_nullable_int((data[3] << 8) | data[4], 10.0, 0xFFFF),
+            temperature_2=from_scaled_nullable_int((data[5] << 8) | data[6], 10.0, 0xFFFF),
+            grill_type=from_nullable_enum_int((data[7] << 8) | data[8], GrillType, 0x0),
+            taste=from_nullable_enum_int((data[9] << 8) | data[10], Taste, 0x0),
             time=timedelta(seconds=int.from_bytes(data[11:13], "big")),
         )
 
     def encode(self) -> bytes:
         seconds = round(self.time.total_seconds())
-        return bytes(
-            [
-                self.type,
-                self.probe,
-                *to_nullable(self.alarm_type, 1, 0xFF),
-                *to_scaled_nullable(self.temperature_1, 2, 10.0, 0xFFFF),
-                *to_scaled_nullable(self.temperature_2, 2, 10.0, 0xFFFF),
-                *to_nullable(self.grill_type, 2, 0x0),
-                *to_nullable(self.taste, 2, 0x0),
-                *seconds.to_bytes(2, "big"),
-            ]
+        return pack_packet(
+            _A8_NOTIFY_PACK,
+            self.type,
+            self.probe,
+            to_nullable_int(self.alarm_type, 0xFF),
+            to_scaled_nullable_int(self.temperature_1, 10.0, 0xFFFF),
+            to_scaled_nullable_int(self.temperature_2, 10.0, 0xFFFF),
+            to_nullable_int(self.grill_type, 0x0),
+            to_nullable_int(self.taste, 0x0),
+            seconds,
         )
 
 
-@dataclass
+_PACKET_DISPATCH[PacketA8Notify.type] = PacketA8Notify._decode_body
+
+
+@dataclass(slots=True)
 class PacketUnknown(PacketNotify):
     type: int
     data: bytes
 
     @classmethod
-    def decode(cls, data: bytes) -> Self:
+    def decode(cls, data: Buffer) -> Self:
         if len(data) < 1:
             raise DecodeError("Packet too short")
-        return cls(data[0], data=data[1:])
+        return cls(data[0], data=bytes(data[1:]))
+
+
+def decode_packet(data: Buffer) -> PacketNotify:
+    if len(data) < 1:
+        raise DecodeError("Failed to parse packet")
+    if (decode := _PACKET_DISPATCH[data[0]]) is None:
+        return PacketUnknown(data[0], bytes(data[1:]))
+    return decode(data)
@@ -4,12 +4,14 @@ from dataclasses import dataclass
 from functools import reduce
 from itertools import chain, tee
 from operator import xor
-from typing import ClassVar, Generic, TypeVar
+from typing import ClassVar, Generic, TypeAlias, TypeVar
 
 from .exceptions import DecodeError
 
 CharacteristicType = TypeVar("CharacteristicType")
 
+Buffer: TypeAlias = bytes | bytearray | memoryview
+
 _PAYLOAD_PREFIX = [0x55, 0xAA]
 
 
@@ -18,7 +20,7 @@ def pretty_name(name: str):
     return " ".join(f"{part[0].upper()}{part[1:]}" for part in data)
 
 
-def wrap_payload(data: bytes) -> bytes:
+def wrap_payload(data: Buffer) -> bytes:
     """Wraps the payload with the prefix and checksum."""
     payload = chain(_PAYLOAD_PREFIX, len(data).to_bytes(2, "big"), data)
     payload, payload_copy = tee(payload, 2)
@@ -26,7 +28,7 @@ def wrap_payload(data: bytes) -> bytes:
     return bytes(chain(payload, [checksum]))
 
 
-def unwrap_payload(data: bytes) -> bytes:
+def unwrap_payload(data: Buffer) -> Buffer:
     """Unwraps the payload, removing the prefix and checksum."""
     if len(data) < 5 or data[0:2] != bytes(_PAYLOAD_PREFIX):
         raise DecodeError("Invalid payload format")
@@ -82,15 +84,15 @@ class Service:
 
 
 @dataclass
-class NotifyCharacteristic(Characteristic[bytes]):
+class NotifyCharacteristic(Characteristic[Buffer]):
     uuid: ClassVar[str] = "0000cee2-0000-1000-8000-00805f9b34fb"
 
     @staticmethod
-    def decode(data: bytes) -> bytes:
+    def decode(data: Buffer) -> Buffer:
         return unwrap_payload(data)
 
     @staticmethod
-    def encode(data: bytes) -> bytes:
+    def encode(data: Buffer) -> bytes:
         return wrap_payload(data)
 
 
@@ -100,7 +102,7 @@ class WriteCharacteristic(Characteristic[bytes]):
 
     @staticmethod
     def decode(data: bytes) -> bytes:
-        return unwrap_payload(data)
+        return bytes(unwrap_payload(data))
 
     @staticmethod
     def encode(data: bytes) -> bytes:
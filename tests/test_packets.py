@@ -2,12 +2,14 @@ from datetime import timedelta
 
 import pytest
 
+from togrill_bluetooth.exceptions import DecodeError
 from togrill_bluetooth.packets import (
     AlarmType,
     GrillType,
     Packet,
     PacketA0Notify,
     PacketA1Notify,
+    PacketA5Notify,
     PacketA6Write,
     PacketA7Write,
     PacketA8Notify,
@@ -17,6 +19,7 @@ from togrill_bluetooth.packets import (
     PacketNotify,
     PacketUnknown,
     Taste,
+    decode_packet,
 )
 
 
@@ -36,13 +39,38 @@ from togrill_bluetooth.packets import (
                 alarm_sound=True,
             ),
         ),
+        (
+            "a0 5b 00 08 00 e1 0a 00",
+            PacketA0Notify(
+                battery=91,
+                version_major=0,
+                version_minor=8,
+                function_type=1,
+                probe_count=6,
+                ambient=True,
+                alarm_interval=10,
+                alarm_sound=False,
+            ),
+        ),
         (
             "a1ffffffffffffffffffffffffffff",
-            PacketA1Notify(temperatures=[None, None, None, None, None, None, None]),
+            PacketA1Notify(temperatures=(None, None, None, None, None, None, None)),
         ),
         (
             "a1 ffff ffff ffff ffff ffff ffff 01b5",
-            PacketA1Notify(temperatures=[None, None, None, None, None, None, 43.7]),
+            PacketA1Notify(temperatures=(None, None, None, None, None, None, 43.7)),
+        ),
+        (
+            "a1 8010 0000 8010",
+            PacketA1Notify(temperatures=(1.6, 0.0, 1.6)),
+        ),
+        (
+            "a5 01 06",
+            PacketA5Notify(probe=1, message=PacketA5Notify.Message.PROBE_DISCONNECTED),
+        ),
+        (
+            "a5 01 0b",
+            PacketA5Notify(probe=1, message=11),
         ),
         (
             "a8 01 00 03 e8 ff ff 00 05 00 00 00 00",
@@ -79,9 +107,23 @@ from togrill_bluetooth.packets import (
     ],
 )
 def test_decode_packet(data: str, result: Packet):
-    packet = PacketNotify.decode(bytes.fromhex(data))
+    packet = decode_packet(bytes.fromhex(data))
     assert packet == result
 
+    packet = PacketNotify.decode(memoryview(bytearray.fromhex(data)))
+    assert packet == result
+
+
+@pytest.mark.parametrize("data", ["", "a05b00", "a501"])
+def test_decode_packet_invalid(data: str):
+    with pytest.raises(DecodeError):
+        decode_packet(bytes.fromhex(data))
+
+
+def test_decode_packet_wrong_type():
+    with pytest.raises(DecodeError):
+        PacketA0Notify.decode(bytes.fromhex("a15b000800600501"))
+
 
 @pytest.mark.parametrize(
     "packet,raw",
@@ -110,6 +152,10 @@ def test_decode_packet(data: str, result: Packet):
             PacketA300Write(probe=1, minimum=1.6, maximum=3.2),
             "a3 01 00 0010 0020",
         ),
+        (
+            PacketA300Write(probe=1, minimum=None, maximum=3.2),
+            "a3 01 00 ffff 0020",
+        ),
         (
             PacketA301Write(probe=1, target=1.6),
             "a3 01 01 0010 0000",
@@ -118,6 +164,16 @@ def test_decode_packet(data: str, result: Packet):
             PacketA303Write(probe=1, grill_type=5),
             "a3 01 03 0005 0000",
         ),
+        (
+            PacketA8Notify(
+                probe=1,
+                alarm_type=AlarmType.TEMPERATURE_TARGET,
+                temperature_1=100,
+                grill_type=GrillType.TURKEY,
+                time=timedelta(seconds=600),
+            ),
+            "a8 01 01 03e8 ffff 0005 0000 0258",
+        ),
     ],
 )
 def test_roundtrip_packet(packet: Packet, raw: str):
@@ -125,3 +181,23 @@ def test_roundtrip_packet(packet: Packet, raw: str):
     packet_bytes = packet.encode()
     assert packet_bytes == raw_bytes
     assert packet == packet.decode(raw_bytes)
+
+
+def test_request_packet():
+    assert PacketA0Notify.request() == bytes.fromhex("a00000")
+    assert PacketA1Notify.request() == bytes.fromhex("a100")
+
+
+@pytest.mark.parametrize(
+    "packet",
+    [
+        PacketA300Write(probe=1, minimum=-5.0, maximum=3.2),
+        PacketA301Write(probe=300, target=1.6),
+        PacketA303Write(probe=1, grill_type=-1),
+        PacketA7Write(probe=0, time=timedelta(hours=20)),
+        PacketA8Notify(probe=1, alarm_type=0, temperature_1=10000),
+    ],
+)
+def test_encode_packet_invalid(packet: Packet):
+    with pytest.raises(ValueError):
+        packet.encode()
@@ -26,3 +26,4 @@ def test_decode_notify(data, result):
     assert (
         NotifyCharacteristic.decode(bytes.fromhex(data)).hex() == bytes(bytes.fromhex(result)).hex()
     )
+    assert NotifyCharacteristic.decode(memoryview(bytearray.fromhex(data))) == bytes.fromhex(result)